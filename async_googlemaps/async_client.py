@@ -21,31 +21,120 @@ HTTP requests).
 """
 import asyncio
 import base64
-import collections
-from datetime import datetime
+import contextvars
 from datetime import timedelta
 import functools
-import hashlib
 import hmac
+import importlib
 import re
-import requests
 import aiohttp
 import random
-import time
 
 import async_googlemaps
 from async_googlemaps import exceptions
 
-try:  # Python 3
-  from urllib.parse import urlencode
-except ImportError:  # Python 2
-  from urllib import urlencode
+from urllib.parse import quote
+
+try:  # Optional, faster JSON parsing.
+  from orjson import loads as _json_loads
+except ImportError:
+  from json import loads as _json_loads
 _X_GOOG_MAPS_EXPERIENCE_ID = "X-Goog-Maps-Experience-ID"
 _USER_AGENT = "GoogleGeoApiClientPython/%s" % async_googlemaps.__version__
 _DEFAULT_BASE_URL = "https://maps.googleapis.com"
 
 _RETRIABLE_STATUSES = {500, 503, 504}
 
+_OK_STATUSES = frozenset({"OK", "ZERO_RESULTS"})
+
+_SIGNATURE_ALGORITHMS = ("sha1", "sha256")
+
+_CHANNEL_RE = re.compile(r"\A[A-Za-z0-9._-]*\Z")
+
+_AUTH_URL_CACHE_SIZE = 4096
+
+# The extra_params of the API method call currently being made, if any. See
+# make_api_method.
+_extra_params_var = contextvars.ContextVar("extra_params", default=None)
+
+
+class _TokenBucket:
+  """Token bucket used to keep the client under its query rate limit.
+
+    The bucket starts full and refills continuously at ``rate`` tokens per
+    second, up to ``capacity``. Rate limit feedback from the server (e.g. a
+    Retry-After header) drains the bucket and holds off further requests.
+    """
+
+  def __init__(self, rate, capacity=None):
+    self.rate = rate
+    # Always allow at least one request in the bucket, otherwise a
+    # fractional rate (e.g. one query every two seconds) could never fill it.
+    self.capacity = capacity or max(1, rate)
+    self.tokens = self.capacity
+    self.last_refill = None
+    self.blocked_until = 0.0
+
+  def _refill(self, now):
+    if self.last_refill is not None:
+      elapsed = now - self.last_refill
+      self.tokens = min(self.capacity, self.tokens + self.rate * elapsed)
+    self.last_refill = now
+
+  async def acquire(self, n=1, deadline=None):
+    """Waits until ``n`` tokens are available, then takes them.
+
+        :param n: The number of tokens to take.
+        :type n: int
+
+        :param deadline: The event loop time by which the tokens must be
+            taken, or None to wait indefinitely.
+        :type deadline: float
+
+        :raises Timeout: if the tokens won't be available by the deadline.
+        """
+    loop = asyncio.get_running_loop()
+    while True:
+      now = loop.time()
+      self._refill(now)
+      if now >= self.blocked_until and self.tokens >= n:
+        self.tokens -= n
+        return
+
+      wait = max(self.blocked_until - now, (n - self.tokens) / self.rate)
+      if deadline is not None and now + wait > deadline:
+        raise exceptions.Timeout()
+      await asyncio.sleep(wait)
+
+  def limit(self, remaining):
+    """Caps the available tokens at the server-reported remaining quota.
+
+        :param remaining: The number of requests the server will still accept.
+        :type remaining: int
+        """
+    self.tokens = min(self.tokens, remaining)
+
+  def penalize(self, retry_after=None):
+    """Drains the bucket, optionally blocking it for a number of seconds.
+
+        :param retry_after: Seconds to wait before the next request, as
+            advised by the server.
+        :type retry_after: float
+        """
+    now = asyncio.get_running_loop().time()
+    self._refill(now)
+    self.tokens = 0
+    if retry_after:
+      self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+def _header_number(headers, name):
+  """Returns the numeric value of a response header, or None."""
+  try:
+    return float(headers[name])
+  except (KeyError, TypeError, ValueError):
+    return None
+
 
 # noinspection PyMethodMayBeStatic,PyProtectedMember
 class AsyncClient:
@@ -56,7 +145,7 @@ class AsyncClient:
                retry_timeout=60, aiohttp_kwargs=None,
                queries_per_second=50, channel=None,
                retry_over_query_limit=True, experience_id=None,
-               base_url=_DEFAULT_BASE_URL):
+               base_url=_DEFAULT_BASE_URL, signature_algorithm="sha1"):
     """
         :param aiohttp_session: Reused persistent session for flexibility.
         :type aiohttp_session: aiohttp.ClientSession
@@ -85,12 +174,11 @@ class AsyncClient:
 
         :param connect_timeout: Connection timeout for HTTP requests, in
             seconds. You should specify read_timeout in addition to this option.
-            Note that this requires requests >= 2.4.0.
         :type connect_timeout: int
 
         :param read_timeout: Read timeout for HTTP requests, in
             seconds. You should specify connect_timeout in addition to this
-            option. Note that this requires requests >= 2.4.0.
+            option.
         :type read_timeout: int
 
         :param retry_timeout: Timeout across multiple retriable requests, in
@@ -100,7 +188,9 @@ class AsyncClient:
         :param queries_per_second: Number of queries per second permitted.
             If the rate limit is reached, the client will sleep for the
             appropriate amount of time before it runs the current query.
-        :type queries_per_second: int
+            May be fractional, e.g. 0.5 for one query every two seconds.
+            None or 0 disables client-side throttling.
+        :type queries_per_second: int or float
 
         :param retry_over_query_limit: If True, requests that result in a
             response indicating the query rate limit was exceeded will be
@@ -113,18 +203,23 @@ class AsyncClient:
 
         :raises ValueError: when either credentials are missing, incomplete
             or invalid.
-        :raises NotImplementedError: if connect_timeout and read_timeout are
-            used with a version of requests prior to 2.4.0.
 
-        :param aiohttp_kwargs: Extra keyword arguments for the requests
-            library, which among other things allow for proxy auth to be
-            implemented. See the official requests docs for more info:
-            http://docs.python-requests.org/en/latest/api/#main-interface
+        :param aiohttp_kwargs: Extra keyword arguments for each aiohttp
+            request, which among other things allow for proxy auth to be
+            implemented. See the official aiohttp docs for more info:
+            https://docs.aiohttp.org/en/stable/client_reference.html
         :type aiohttp_kwargs: dict
 
         :param base_url: The base URL for all requests. Defaults to the Maps API
             server. Should not have a trailing slash.
         :type base_url: string
+
+        :param signature_algorithm: (for Maps API for Work customers) The hash
+            used for HMAC URL signatures. Standard Maps Platform URL signing
+            requires "sha1" (the default); the Maps web services reject URLs
+            signed any other way. Use "sha256" only against endpoints that
+            verify HMAC-SHA256 signatures.
+        :type signature_algorithm: string
         """
     if not key and not (client_secret and client_id):
       raise ValueError("Must provide API key or enterprise credentials "
@@ -133,8 +228,12 @@ class AsyncClient:
     if key and not key.startswith("AIza"):
       raise ValueError("Invalid API key provided.")
 
+    if signature_algorithm not in _SIGNATURE_ALGORITHMS:
+      raise ValueError("The signature_algorithm argument must be one of: %s"
+                       % ", ".join(_SIGNATURE_ALGORITHMS))
+
     if channel:
-      if not re.match("^[a-zA-Z0-9._-]*$", channel):
+      if not _CHANNEL_RE.match(channel):
         raise ValueError("The channel argument must be an ASCII "
                          "alphanumeric string. The period (.), underscore (_)"
                          "and hyphen (-) characters are allowed. If used without "
@@ -143,8 +242,16 @@ class AsyncClient:
       raise ValueError("The aiohttp_client argument must me an instance of aiohttp.ClientSession"
                        "e.g. aiohttp_client = aiohttp.ClientSession()")
     self.key = key
+    self._key_qs = "key=" + quote(key, safe="") if key else None
+    self._encoded_key = key
     self.client_id = client_id
     self.client_secret = client_secret
+    # The secret is only used for signing, which needs a client ID too.
+    self._client_secret_bytes = None
+    self._client_secret_bytes_source = None
+    if client_id and client_secret:
+      self._get_client_secret_bytes()
+    self.signature_algorithm = signature_algorithm
     self.channel = channel
     self.retry_timeout = timedelta(seconds=retry_timeout)
     self.aiohttp_kwargs = aiohttp_kwargs or {}
@@ -169,9 +276,12 @@ class AsyncClient:
 
     self.queries_per_second = queries_per_second
     self.retry_over_query_limit = retry_over_query_limit
-    self.sent_times = collections.deque("", queries_per_second)
+    self._bucket = (_TokenBucket(queries_per_second)
+                    if queries_per_second else None)
     self.set_experience_id(experience_id)
     self.base_url = base_url
+    self._cached_auth_url = functools.lru_cache(
+      maxsize=_AUTH_URL_CACHE_SIZE)(self._build_frozen_auth_url)
 
   async def __aenter__(self):
     return self
@@ -231,6 +341,41 @@ class AsyncClient:
     headers.pop(_X_GOOG_MAPS_EXPERIENCE_ID, {})
     self.aiohttp_kwargs["headers"] = headers
 
+  async def bulk(self, coros, concurrency=64):
+    """Runs many API calls concurrently, e.g. geocoding a list of addresses.
+
+        At most ``concurrency`` of the calls are in flight at once. Requests
+        still go through the client's rate limiter, so ``queries_per_second``
+        is respected regardless of ``concurrency``. The aiohttp session's
+        connector also caps open connections; for large batches create the
+        session with e.g. ``aiohttp.TCPConnector(limit_per_host=64)``.
+
+        :param coros: The API calls to run, e.g.
+            ``[client.geocode(a) for a in addresses]``.
+        :type coros: iterable of coroutines
+
+        :param concurrency: The maximum number of calls in flight at once.
+        :type concurrency: int
+
+        :return: The result of each call, in the same order as ``coros``. A
+            call that raised has its exception in place of a result.
+        :rtype: list
+        """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _run(coro):
+      try:
+        async with sem:
+          return await coro
+      finally:
+        # If bulk() is cancelled while this call is still queued, the
+        # coroutine was never started; close it to avoid a "never awaited"
+        # warning. This does nothing to a coroutine that has finished.
+        coro.close()
+
+    return await asyncio.gather(*(_run(c) for c in coros),
+                                return_exceptions=True)
+
   async def _request(self, url, params, first_request_time=None, retry_counter=0,
                      base_url=None, accepts_clientid=True,
                      extract_body=None, aiohttp_kwargs=None, post_json=None):
@@ -243,9 +388,9 @@ class AsyncClient:
         :param params: HTTP GET parameters.
         :type params: dict or list of key/value tuples
 
-        :param first_request_time: The time of the first request (None if no
-            retries have occurred).
-        :type first_request_time: datetime.datetime
+        :param first_request_time: The event loop time of the first request
+            (None if no retries have occurred).
+        :type first_request_time: float
 
         :param retry_counter: The number of this retry, or zero for first attempt.
         :type retry_counter: int
@@ -277,70 +422,96 @@ class AsyncClient:
     if base_url is None:
       base_url = self.base_url
 
+    # Use the event loop's monotonic clock throughout, so that wall clock
+    # adjustments can't cut retries short or stall them.
+    loop = asyncio.get_running_loop()
     if not first_request_time:
-      first_request_time = datetime.now()
-
-    elapsed = datetime.now() - first_request_time
-    if elapsed > self.retry_timeout:
-      raise exceptions.Timeout()
-
-    if retry_counter > 0:
-      # 0.5 * (1.5 ^ i) is an increased sleep time of 1.5x per iteration,
-      # starting at 0.5s when retry_counter=0. The first retry will occur
-      # at 1, so subtract that first.
-      delay_seconds = 0.5 * 1.5 ** (retry_counter - 1)
-
-      # Jitter this value by 50% and pause.
-      time.sleep(delay_seconds * (random.random() + 0.5))
+      first_request_time = loop.time()
+    retry_timeout = self.retry_timeout.total_seconds()
 
     authed_url = self._generate_auth_url(url, params, accepts_clientid)
 
-    # Default to the client-level self.requests_kwargs, with method-level
-    # requests_kwargs arg overriding.
-    aiohttp_kwargs = aiohttp_kwargs or {}
-    final_requests_kwargs = dict(self.aiohttp_kwargs, **aiohttp_kwargs)
+    # Default to the client-level self.aiohttp_kwargs, with method-level
+    # aiohttp_kwargs arg overriding. The client-level dict is only copied
+    # when something needs to be added to it, and is never mutated here.
+    final_requests_kwargs = self.aiohttp_kwargs
+    if aiohttp_kwargs:
+      final_requests_kwargs = {**final_requests_kwargs, **aiohttp_kwargs}
 
     # Determine GET/POST.
     requests_method = self.aiohttp_session.get
     if post_json is not None:
       requests_method = self.aiohttp_session.post
-      final_requests_kwargs["json"] = post_json
-    try:
-      async with requests_method(base_url + authed_url, **final_requests_kwargs) as response:
-        if response.status in _RETRIABLE_STATUSES:
-          # Retry request.
-          return await self._request(url, params, first_request_time,
-                                     retry_counter + 1, base_url, accepts_clientid,
-                                     extract_body, aiohttp_kwargs, post_json)
-
-        # Check if the time of the nth previous query (where n is
-        # queries_per_second) is under a second ago - if so, sleep for
-        # the difference.
-        if self.sent_times and len(self.sent_times) == self.queries_per_second:
-          elapsed_since_earliest = time.time() - self.sent_times[0]
-          if elapsed_since_earliest < 1:
-            time.sleep(1 - elapsed_since_earliest)
-
-        try:
-          if extract_body:
-            result = await extract_body(response)
-          else:
-            result = await self._get_body(response)
-          self.sent_times.append(time.time())
-          return result
-        except exceptions._RetriableRequest as e:
-          if isinstance(e, exceptions._OverQueryLimit) and not self.retry_over_query_limit:
-            raise
-
-          # Retry request.
-          return self._request(url, params, first_request_time,
-                               retry_counter + 1, base_url, accepts_clientid,
-                               extract_body, aiohttp_kwargs, post_json)
-
-    except asyncio.TimeoutError:
-      raise exceptions.Timeout()
-    except Exception as e:
-      raise exceptions.TransportError(e)
+      final_requests_kwargs = {**final_requests_kwargs, "json": post_json}
+
+    delay_seconds = 0.5
+    while True:
+      elapsed = loop.time() - first_request_time
+      if elapsed > retry_timeout:
+        raise exceptions.Timeout()
+
+      if retry_counter > 0:
+        # Decorrelated jitter: each delay is drawn between 0.5s and three
+        # times the previous one, so clients that failed together don't all
+        # retry together.
+        delay_seconds = random.uniform(0.5, delay_seconds * 3)
+
+        # Never sleep past the retry timeout.
+        remaining = retry_timeout - (loop.time() - first_request_time)
+        if delay_seconds >= remaining:
+          raise exceptions.Timeout()
+        await asyncio.sleep(delay_seconds)
+
+      # Wait for a token so that we stay under queries_per_second, or
+      # whatever tighter budget the server has reported, giving up if that
+      # would take us past the retry timeout.
+      if self._bucket is not None:
+        await self._bucket.acquire(
+          deadline=first_request_time + retry_timeout)
+
+      over_query_limit = False
+      try:
+        async with requests_method(base_url + authed_url, **final_requests_kwargs) as response:
+          retry_after = self._update_rate_limit(response)
+          if response.status not in _RETRIABLE_STATUSES:
+            try:
+              if extract_body:
+                return await extract_body(response)
+              return await self._get_body(response)
+            except exceptions._RetriableRequest as e:
+              if isinstance(e, exceptions._OverQueryLimit):
+                if not self.retry_over_query_limit:
+                  raise
+                over_query_limit = True
+
+      except asyncio.TimeoutError:
+        raise exceptions.Timeout()
+      except Exception as e:
+        raise exceptions.TransportError(e)
+
+      # Retry request. If the server asked us to back off, hold off every
+      # request made by this client, not just this one.
+      if self._bucket is not None and (over_query_limit or
+                                       retry_after is not None):
+        self._bucket.penalize(retry_after)
+      retry_counter += 1
+
+  def _update_rate_limit(self, response):
+    """Feeds the remaining quota reported by a response back into the
+        token bucket, if the client is throttled.
+
+        :param response: The HTTP response.
+        :type response: aiohttp.ClientResponse
+
+        :return: The Retry-After delay in seconds, if the server sent one.
+            It is applied to the bucket by ``_request`` when retrying.
+        :rtype: float
+        """
+    if self._bucket is not None:
+      remaining = _header_number(response.headers, "X-RateLimit-Remaining")
+      if remaining is not None:
+        self._bucket.limit(remaining)
+    return _header_number(response.headers, "Retry-After")
 
   async def _get(self, *args, **kwargs):  # Backwards compatibility.
     return await self._request(*args, **kwargs)
@@ -349,16 +520,17 @@ class AsyncClient:
     if response.status != 200:
       raise exceptions.HTTPError(response.status)
 
-    body = await response.json()
+    body = _json_loads(await response.read())
 
     api_status = body["status"]
-    if api_status == "OK" or api_status == "ZERO_RESULTS":
+    if api_status in _OK_STATUSES:
       return body
 
+    error_message = body.get("error_message")
     if api_status == "OVER_QUERY_LIMIT":
-      raise exceptions._OverQueryLimit(api_status, body.get("error_message"))
+      raise exceptions._OverQueryLimit(api_status, error_message)
 
-    raise exceptions.ApiError(api_status, body.get("error_message"))
+    raise exceptions.ApiError(api_status, error_message)
 
   def _generate_auth_url(self, path, params, accepts_clientid):
     """Returns the path and query string portion of the request URL, first
@@ -372,97 +544,179 @@ class AsyncClient:
 
         :rtype: string
         """
-    # Deterministic ordering through sorting by key.
-    # Useful for tests, and in the future, any caching.
-    extra_params = getattr(self, "_extra_params", None) or {}
-    if type(params) is dict:
-      params = sorted(dict(extra_params, **params).items())
-    else:
-      params = sorted(extra_params.items()) + params[:]  # Take a copy.
+    extra_params = _extra_params_var.get()
+    if extra_params:
+      # Extra params are an advanced, rarely used feature; don't cache them.
+      return self._build_auth_url(path, params, accepts_clientid, extra_params)
+
+    # The credentials are part of the cache key, so that changing them on
+    # the client doesn't keep serving URLs built with the old ones.
+    credentials = (self.key, self.client_id, self.client_secret, self.channel,
+                   self.signature_algorithm)
+    return self._cached_auth_url(path, _freeze_params(params),
+                                 type(params) is dict, accepts_clientid,
+                                 credentials)
+
+  def _build_frozen_auth_url(self, path, params, is_dict, accepts_clientid,
+                             credentials):
+    """Builds a URL from parameters converted by ``_freeze_params``. This is
+        what the per-client URL cache wraps.
+
+        :param is_dict: Whether the parameters were originally a dict.
+        :type is_dict: bool
+
+        :param credentials: The client's credentials. Only used as part of
+            the cache key.
+        :type credentials: tuple
+
+        :rtype: string
+        """
+    return self._build_auth_url(path, dict(params) if is_dict else params,
+                                accepts_clientid)
+
+  def _get_key_qs(self):
+    """Returns the encoded "key=..." query string parameter, encoding it
+        again only if key has been changed.
+
+        :rtype: string
+        """
+    if self._encoded_key != self.key:
+      self._key_qs = "key=" + quote(self.key, safe="")
+      self._encoded_key = self.key
+    return self._key_qs
+
+  def _get_client_secret_bytes(self):
+    """Returns the base64-decoded client secret, decoding it again only if
+        client_secret has been changed.
+
+        :rtype: bytes
+        """
+    if self._client_secret_bytes_source != self.client_secret:
+      self._client_secret_bytes = base64.urlsafe_b64decode(
+        self.client_secret.encode('ascii', 'strict'))
+      self._client_secret_bytes_source = self.client_secret
+    return self._client_secret_bytes
+
+  def _build_auth_url(self, path, params, accepts_clientid, extra_params=None):
+    """Builds the URL returned by ``_generate_auth_url``, bypassing the
+        cache.
 
+        :param extra_params: Additional URL parameters, merged under params.
+        :type extra_params: dict
+
+        :rtype: string
+        """
+    extra_params = extra_params or {}
     if accepts_clientid and self.client_id and self.client_secret:
+      # Deterministic ordering through sorting by key.
+      # Useful for tests, and for caching.
+      if type(params) is dict:
+        params = sorted(_merge_params(extra_params, params))
+      else:
+        params = sorted(extra_params.items()) + list(params)  # Take a copy.
+
       if self.channel:
         params.append(("channel", self.channel))
       params.append(("client", self.client_id))
 
       path = "?".join([path, urlencode_params(params)])
-      sig = sign_hmac(self.client_secret, path)
+      sig = sign_hmac_bytes(self._get_client_secret_bytes(), path,
+                            self.signature_algorithm)
       return path + "&signature=" + sig
 
     if self.key:
-      params.append(("key", self.key))
-      return path + "?" + urlencode_params(params)
+      # Nothing is signed, so the parameters can be sent in the order given.
+      if type(params) is dict:
+        if extra_params:
+          params = _merge_params(extra_params, params)
+        else:
+          params = params.items()
+      elif extra_params:
+        params = list(extra_params.items()) + list(params)
+
+      # The encoded key is reused across requests until key is changed.
+      query = urlencode_params(params)
+      if query:
+        return path + "?" + query + "&" + self._get_key_qs()
+      return path + "?" + self._get_key_qs()
 
     raise ValueError("Must provide API key for this API. It does not accept "
                      "enterprise credentials.")
 
 
-from async_googlemaps.directions import directions
-from async_googlemaps.distance_matrix import distance_matrix
-from async_googlemaps.elevation import elevation
-from async_googlemaps.elevation import elevation_along_path
-from async_googlemaps.geocoding import geocode
-from async_googlemaps.geocoding import reverse_geocode
-from async_googlemaps.geolocation import geolocate
-from async_googlemaps.timezone import timezone
-from async_googlemaps.roads import snap_to_roads
-from async_googlemaps.roads import nearest_roads
-from async_googlemaps.roads import speed_limits
-from async_googlemaps.roads import snapped_speed_limits
-from async_googlemaps.places import find_place
-from async_googlemaps.places import places
-from async_googlemaps.places import places_nearby
-from async_googlemaps.places import place
-from async_googlemaps.places import places_photo
-from async_googlemaps.places import places_autocomplete
-from async_googlemaps.places import places_autocomplete_query
-from async_googlemaps.maps import static_map
-
-
 def make_api_method(func):
   """
     Provides a single entry point for modifying all API methods.
-    For now this is limited to allowing the client object to be modified
-    with an `extra_params` keyword arg to each method, that is then used
-    as the params for each web service request.
+    For now this is limited to allowing an `extra_params` keyword arg to
+    each method, that is then used as the params for each web service
+    request.
+
+    The extra params are held in a context variable for the duration of the
+    call, so concurrent calls on the same client don't see each other's.
 
     Please note that this is an unsupported feature for advanced use only.
-    It's also currently incompatibile with multiple threads, see GH #160.
     """
 
   @functools.wraps(func)
-  def wrapper(*args, **kwargs):
-    args[0]._extra_params = kwargs.pop("extra_params", None)
-    result = func(*args, **kwargs)
+  async def wrapper(*args, **kwargs):
+    token = _extra_params_var.set(kwargs.pop("extra_params", None))
     try:
-      del args[0]._extra_params
-    except AttributeError:
-      pass
-    return result
+      return await func(*args, **kwargs)
+    finally:
+      _extra_params_var.reset(token)
 
   return wrapper
 
 
-AsyncClient.directions = make_api_method(directions)
-AsyncClient.distance_matrix = make_api_method(distance_matrix)
-AsyncClient.elevation = make_api_method(elevation)
-AsyncClient.elevation_along_path = make_api_method(elevation_along_path)
-AsyncClient.geocode = make_api_method(geocode)
-AsyncClient.reverse_geocode = make_api_method(reverse_geocode)
-AsyncClient.geolocate = make_api_method(geolocate)
-AsyncClient.timezone = make_api_method(timezone)
-AsyncClient.snap_to_roads = make_api_method(snap_to_roads)
-AsyncClient.nearest_roads = make_api_method(nearest_roads)
-AsyncClient.speed_limits = make_api_method(speed_limits)
-AsyncClient.snapped_speed_limits = make_api_method(snapped_speed_limits)
-AsyncClient.find_place = make_api_method(find_place)
-AsyncClient.places = make_api_method(places)
-AsyncClient.places_nearby = make_api_method(places_nearby)
-AsyncClient.place = make_api_method(place)
-AsyncClient.places_photo = make_api_method(places_photo)
-AsyncClient.places_autocomplete = make_api_method(places_autocomplete)
-AsyncClient.places_autocomplete_query = make_api_method(places_autocomplete_query)
-AsyncClient.static_map = make_api_method(static_map)
+# API methods of AsyncClient, and the modules they are defined in. Each
+# module is only imported when one of its methods is first used, see
+# _LazyApiMethod.
+_API_METHODS = {
+  "directions": "directions",
+  "distance_matrix": "distance_matrix",
+  "elevation": "elevation",
+  "elevation_along_path": "elevation",
+  "geocode": "geocoding",
+  "reverse_geocode": "geocoding",
+  "geolocate": "geolocation",
+  "timezone": "timezone",
+  "snap_to_roads": "roads",
+  "nearest_roads": "roads",
+  "speed_limits": "roads",
+  "snapped_speed_limits": "roads",
+  "find_place": "places",
+  "places": "places",
+  "places_nearby": "places",
+  "place": "places",
+  "places_photo": "places",
+  "places_autocomplete": "places",
+  "places_autocomplete_query": "places",
+  "static_map": "maps",
+}
+
+
+class _LazyApiMethod:
+  """Placeholder for an AsyncClient API method that imports the module
+    defining it on first access, then replaces itself on the class with the
+    wrapped function, so later lookups are plain attribute access.
+    """
+
+  def __init__(self, module, name):
+    self.module = module
+    self.name = name
+
+  def __get__(self, instance, owner=None):
+    func = getattr(importlib.import_module("async_googlemaps." + self.module),
+                   self.name)
+    method = make_api_method(func)
+    setattr(owner, self.name, method)
+    if instance is None:
+      return method
+    return method.__get__(instance, owner)
+
+
+for _name, _module in _API_METHODS.items():
+  setattr(AsyncClient, _name, _LazyApiMethod(_module, _name))
 
 
 def sign_hmac(secret, payload):
@@ -476,34 +730,84 @@ def sign_hmac(secret, payload):
 
     :rtype: string
     """
-  payload = payload.encode('ascii', 'strict')
   secret = secret.encode('ascii', 'strict')
-  sig = hmac.new(base64.urlsafe_b64decode(secret), payload, hashlib.sha1)
-  out = base64.urlsafe_b64encode(sig.digest())
+  return sign_hmac_bytes(base64.urlsafe_b64decode(secret), payload)
+
+
+def sign_hmac_bytes(secret, payload, algorithm="sha1"):
+  """Returns a base64-encoded HMAC signature of a given string.
+
+    :param secret: The key used for the signature, already base64 decoded.
+    :type secret: bytes
+
+    :param payload: The payload to sign.
+    :type payload: string
+
+    :param algorithm: The hash algorithm, "sha1" or "sha256".
+    :type algorithm: string
+
+    :rtype: string
+    """
+  payload = payload.encode('ascii', 'strict')
+  digest = hmac.digest(secret, payload, algorithm)
+  out = base64.urlsafe_b64encode(digest)
   return out.decode('utf-8')
 
 
+def _freeze_params(params):
+  """Converts URL parameters to a hashable tuple of key/value tuples, with
+    every value in the string form it is encoded as. Values that compare
+    equal but encode differently (e.g. 1, 1.0 and True) stay distinct.
+
+    :param params: URL parameters.
+    :type params: dict or list of key/value tuples
+
+    :rtype: tuple
+    """
+  if type(params) is dict:
+    params = params.items()
+  return tuple(
+    (key, tuple(normalize_for_urlencode(v) for v in val)
+    if isinstance(val, (list, tuple)) else normalize_for_urlencode(val))
+    for key, val in params)
+
+
+def _merge_params(extra_params, params):
+  """Yields the key/value tuples of extra_params that aren't overridden by
+    params, followed by those of params, without building a merged dict.
+
+    :param extra_params: The extra parameters.
+    :type extra_params: dict
+
+    :param params: The request's own parameters.
+    :type params: dict
+
+    :rtype: iterator of key/value tuples
+    """
+  for item in extra_params.items():
+    if item[0] not in params:
+      yield item
+  yield from params.items()
+
+
 def urlencode_params(params):
   """URL encodes the parameters.
 
     :param params: The parameters
-    :type params: list of key/value tuples.
+    :type params: iterable of key/value tuples.
 
     :rtype: string
     """
-  # urlencode does not handle unicode strings in Python 2.
-  # Firstly, normalize the values so they get encoded correctly.
-  extended = []
-  for key, val in params:
-    if isinstance(val, (list, tuple)):
-      for v in val:
-        extended.append((key, normalize_for_urlencode(v)))
-    else:
-      extended.append((key, normalize_for_urlencode(val)))
-  # Secondly, unquote unreserved chars which are incorrectly quoted
-  # by urllib.urlencode, causing invalid auth signatures. See GH #72
+  # quote() leaves exactly the RFC 3986 unreserved characters as they are;
+  # quoting any of them would cause invalid auth signatures. See GH #72
   # for more info.
-  return requests.utils.unquote_unreserved(urlencode(extended))
+  parts = []
+  for key, val in params:
+    key = quote(str(key), safe="")
+    vals = val if isinstance(val, (list, tuple)) else (val,)
+    for v in vals:
+      parts.append(key + "=" + quote(normalize_for_urlencode(v), safe=""))
+  return "&".join(parts)
 
 
 try:
@@ -526,8 +830,8 @@ try:
 
 except NameError:
   def normalize_for_urlencode(value):
-    """(Python 3) No-op."""
-    # urlencode in Python 3 handles all the types we are passing it.
+    """(Python 3) Converts the value to a `str`."""
+    # quote() only accepts str (or bytes), so stringify everything else.
     if isinstance(value, str):
       return value
 
@@ -97,7 +97,7 @@ async def speed_limits(client, place_ids):
                                 extract_body=_roads_extract)).get("speedLimits", [])
 
 
-def snapped_speed_limits(client, path):
+async def snapped_speed_limits(client, path):
   """Returns the posted speed limit (in km/h) for given road segments.
 
     The provided points will first be snapped to the most likely roads the
@@ -112,10 +112,10 @@ def snapped_speed_limits(client, path):
 
   params = {"path": convert.location_list(path)}
 
-  return client._request("/v1/speedLimits", params,
-                         base_url=_ROADS_BASE_URL,
-                         accepts_clientid=False,
-                         extract_body=_roads_extract)
+  return await client._request("/v1/speedLimits", params,
+                               base_url=_ROADS_BASE_URL,
+                               accepts_clientid=False,
+                               extract_body=_roads_extract)
 
 
 async def _roads_extract(resp):
@@ -1,6 +1,6 @@
 import setuptools
 from setuptools import setup
-requirements = ["requests", "aiohttp"]
+requirements = ["aiohttp"]
 
 with open("README.md") as f:
     readme = f.read()
@@ -18,15 +18,14 @@ setup(
     platforms="Posix; MacOS X; Windows",
     setup_requires=requirements,
     install_requires=requirements,
+    extras_require={"orjson": ["orjson"]},
     classifiers=[
         "Intended Audience :: Developers",
         "License :: OSI Approved :: Apache Software License",
         "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Topic :: Internet",
     ],
-    python_requires='>=3.5'
+    python_requires='>=3.7'
 )